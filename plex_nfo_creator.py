@@ -8,13 +8,43 @@ Usage: python plex_nfo_creator.py --token TOKEN --root-path PATH [options]
 import os
 import sys
 import re
+import queue
+import atexit
 import logging
+import logging.handlers
 import argparse
 import platform
+import asyncio
+import functools
+import unicodedata
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 from tqdm import tqdm
 from plexapi.server import PlexServer
 from plexapi.exceptions import NotFound
 
+# The OS does not change at runtime, so check it once
+_IS_WINDOWS = platform.system() == 'Windows'
+
+# Guid schemes read by the primary ID extraction method for each library type,
+# in the order their links are preferred for NFO files
+_GUID_SCHEMES = {'movie': ('imdb', 'tmdb'), 'tv': ('imdb', 'tvdb')}
+_URL_TEMPLATES = {
+    'imdb': 'https://www.imdb.com/title/{}/',
+    'tmdb': 'https://www.themoviedb.org/movie/{}',
+    'tvdb': 'https://thetvdb.com/series/{}',
+}
+
+# Pattern used by the secondary ID extraction method, one named group per ID type
+_FALLBACK_RE = re.compile(r'(?P<imdb>tt\d+)|tmdb://(?P<tmdb>\d+)|tvdb://(?P<tvdb>\d+)')
+_ID_LABELS = {'imdb': 'IMDb', 'tmdb': 'TMDb', 'tvdb': 'TVDB'}
+
+# Flags for writing NFO files with a raw file descriptor (O_BINARY only exists on Windows)
+_NFO_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_CLOEXEC', 0) | getattr(os, 'O_BINARY', 0)
+
+# Number of items requested from Plex per library page
+_PLEX_PAGE_SIZE = 500
+
 # Configure logging
 def setup_logging():
     """Configure logging with proper Unicode handling."""
@@ -30,7 +60,7 @@ def setup_logging():
                 msg = self.format(record)
                 stream = self.stream
                 # Replace characters that can't be encoded
-                if platform.system() == 'Windows':
+                if _IS_WINDOWS:
                     # For Windows console
                     try:
                         stream.write(msg + self.terminator)
@@ -56,15 +86,28 @@ def setup_logging():
     logger = logging.getLogger(__name__)
     logger.setLevel(logging.INFO)
     
+    # Hand records to a background listener thread so file and console
+    # writes do not block item processing
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, file_handler, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+    
     # Add handlers
-    logger.addHandler(file_handler)
-    logger.addHandler(stream_handler)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
     
     # Prevent propagation to root logger
     logger.propagate = False
     
     return logger
 
+def positive_int(value):
+    """argparse type for options that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
 def parse_args():
     parser = argparse.ArgumentParser(description='Create NFO files from Plex metadata')
     parser.add_argument('--url', default='http://localhost:32400', help='Plex server URL')
@@ -73,6 +116,8 @@ def parse_args():
     parser.add_argument('--type', default='movie', choices=['movie', 'tv'], help='Library type: movie or tv')
     parser.add_argument('--root-path', required=True, help='Root path of the media library')
     parser.add_argument('--dry-run', action='store_true', help='Simulate operations without writing files')
+    parser.add_argument('--force', action='store_true', help='Recreate NFO files that already exist')
+    parser.add_argument('--workers', type=positive_int, default=64, help='Number of items processed concurrently')
     return parser.parse_args()
 
 def connect_to_plex(url, token):
@@ -87,48 +132,37 @@ def get_ids(item, item_type):
     """Extract IDs from Plex item metadata."""
     ids = {'imdb': None, 'tmdb': None, 'tvdb': None}
     method_used = "primary"
+    schemes = _GUID_SCHEMES[item_type]
     
     try:
         # Method 1: Extract from guids
         if hasattr(item, 'guids') and item.guids:
             for guid in item.guids:
-                guid_id = guid.id.lower() if hasattr(guid, 'id') else str(guid).lower()
+                guid_id = guid.id if hasattr(guid, 'id') else str(guid)
                 
-                if 'imdb://' in guid_id:
-                    ids['imdb'] = guid_id.split('imdb://')[1].split('?')[0]
-                elif 'tmdb://' in guid_id and item_type == 'movie':
-                    ids['tmdb'] = guid_id.split('tmdb://')[1].split('?')[0]
-                elif 'tvdb://' in guid_id and item_type == 'tv':
-                    ids['tvdb'] = guid_id.split('tvdb://')[1].split('?')[0]
+                # Guids look like imdb://tt1234567, so dispatch on the scheme
+                scheme, _, value = guid_id.partition('://')
+                scheme = scheme.lower()
+                if scheme in schemes:
+                    ids[scheme] = value.partition('?')[0]
+                    # Stop once every ID this library type uses has been found
+                    if all(ids[wanted] for wanted in schemes):
+                        break
         
         # Method 2: Try to extract from other metadata if needed
-        if not (ids['imdb'] or (ids['tmdb'] and item_type == 'movie') or (ids['tvdb'] and item_type == 'tv')):
+        if not any(ids[scheme] for scheme in schemes):
             method_used = "secondary"
             
             if hasattr(item, 'fields'):
                 for field in item.fields:
                     if field.name == 'guid':
                         value = field.value.lower()
-                        # Extract IMDb ID
-                        if not ids['imdb']:
-                            imdb_match = re.search(r'(tt\d+)', value)
-                            if imdb_match:
-                                ids['imdb'] = imdb_match.group(1)
-                                logger.info(f"Found IMDb ID using secondary method: {ids['imdb']}")
-                        
-                        # Extract TMDb ID for movies
-                        if not ids['tmdb'] and item_type == 'movie':
-                            tmdb_match = re.search(r'tmdb://(\d+)', value)
-                            if tmdb_match:
-                                ids['tmdb'] = tmdb_match.group(1)
-                                logger.info(f"Found TMDb ID using secondary method: {ids['tmdb']}")
-                        
-                        # Extract TVDB ID for TV shows
-                        if not ids['tvdb'] and item_type == 'tv':
-                            tvdb_match = re.search(r'tvdb://(\d+)', value)
-                            if tvdb_match:
-                                ids['tvdb'] = tvdb_match.group(1)
-                                logger.info(f"Found TVDB ID using secondary method: {ids['tvdb']}")
+                        # Scan the value once, keeping the first ID of each wanted type
+                        for match in _FALLBACK_RE.finditer(value):
+                            scheme = match.lastgroup
+                            if scheme in schemes and not ids[scheme]:
+                                ids[scheme] = match.group(scheme)
+                                logger.info(f"Found {_ID_LABELS[scheme]} ID using secondary method: {ids[scheme]}")
         
         return ids, method_used
     except Exception as e:
@@ -139,7 +173,7 @@ def normalize_path(path):
     """Normalize path for the current operating system."""
     path = os.path.abspath(path)
     
-    if platform.system() == 'Windows':
+    if _IS_WINDOWS:
         # Just normalize path separators, but preserve case
         path = os.path.normpath(path)
     else:
@@ -147,19 +181,89 @@ def normalize_path(path):
     
     return path
 
-def get_local_path(plex_path, root_path, item_type):
-    """Convert Plex path to local filesystem path using the provided root path."""
-    import unicodedata
-    
-    def normalize_unicode(text):
-        """Normalize Unicode to NFC form for filenames."""
-        if isinstance(text, str):
-            return unicodedata.normalize('NFC', text)
-        return text
-    
-    # Normalize paths without changing case
-    plex_path = normalize_path(normalize_unicode(plex_path))
-    root_path = normalize_path(normalize_unicode(root_path))
+def scan_tree(path):
+    """Yield (DirEntry, is_dir) pairs below path in the same top-down order as os.walk.
+    
+    os.scandir caches the file type from the directory read, so classifying
+    entries does not need an extra stat call per entry.
+    """
+    try:
+        with os.scandir(path) as it:
+            entries = [(entry, entry.is_dir()) for entry in it]
+    except OSError as e:
+        logger.debug(f"Cannot scan directory {path}: {e}")
+        return
+    
+    yield from entries
+    
+    # Like os.walk, list symlinked directories but do not descend into them
+    for entry, is_dir in entries:
+        if is_dir and not entry.is_symlink():
+            yield from scan_tree(entry.path)
+
+def build_dir_index(root_path, item_type):
+    """Scan the root path once and index directory (and movie file) names.
+    
+    Entries are keyed by os.path.normcase(name) and hold full paths in walk order,
+    so lookups are case-insensitive on Windows and exact elsewhere.
+    The root path is expected to be normalized already.
+    """
+    index = {'dirs': {}, 'files': {}, 'root_drive': os.path.splitdrive(root_path)[0]}
+    
+    for entry, is_dir in scan_tree(root_path):
+        if is_dir:
+            index['dirs'].setdefault(os.path.normcase(entry.name), []).append(entry.path)
+        # Movies fall back to matching files by name without extension
+        elif item_type == 'movie':
+            file_without_ext = os.path.splitext(entry.name)[0]
+            index['files'].setdefault(os.path.normcase(file_without_ext), []).append(entry.path)
+    
+    return index
+
+def lookup_index(entries, name):
+    """Return the indexed paths matching name, case-insensitively on Windows."""
+    return entries.get(os.path.normcase(name), [])
+
+@functools.lru_cache(maxsize=4096)
+def list_folder(folder_path):
+    """Return {normcased name: path} for a folder's entries, cached across items sharing it."""
+    with os.scandir(folder_path) as it:
+        return {os.path.normcase(entry.name): entry.path for entry in it}
+
+def normalize_unicode(text):
+    """Normalize Unicode to NFC form for filenames."""
+    if isinstance(text, str):
+        return unicodedata.normalize('NFC', text)
+    return text
+
+@dataclass(frozen=True)
+class ItemPaths:
+    """Components of a Plex item path, parsed once per item."""
+    plex_path: str
+    folder_name: str
+    base_name: str
+    stem: str
+    
+    @classmethod
+    def from_plex_path(cls, plex_path):
+        # Normalize paths without changing case
+        plex_path = normalize_path(normalize_unicode(plex_path))
+        folder, base_name = os.path.split(plex_path)
+        return cls(
+            plex_path=plex_path,
+            folder_name=os.path.basename(folder),
+            base_name=base_name,
+            stem=os.path.splitext(base_name)[0],
+        )
+
+def get_local_path(paths, root_path, item_type, dir_index):
+    """Convert Plex path to local filesystem path using the provided root path.
+    
+    Falls back to the Plex path itself if it exists locally (e.g. when run on
+    the Plex host for a folder outside the root path), and returns None if no
+    existing local path could be found.
+    """
+    plex_path = paths.plex_path
     
     logger.debug(f"Finding local path for Plex path: {plex_path}")
     logger.debug(f"Using root path: {root_path}")
@@ -170,13 +274,13 @@ def get_local_path(plex_path, root_path, item_type):
         return plex_path
     
     # Handle drive letter mapping (e.g., C:\filme to Y:\filme)
-    if platform.system() == 'Windows':
+    if _IS_WINDOWS:
         # Extract the drive letters, but don't change case for the full paths
         plex_drive_letter = os.path.splitdrive(plex_path)[0]
-        root_drive_letter = os.path.splitdrive(root_path)[0]
+        root_drive_letter = dir_index['root_drive']
         
-        # For comparison only, use lowercase
-        if plex_drive_letter.lower() != root_drive_letter.lower() and plex_drive_letter:
+        # For comparison only, ignore case
+        if os.path.normcase(plex_drive_letter) != os.path.normcase(root_drive_letter) and plex_drive_letter:
             # Get the path without the drive letter
             plex_path_no_drive = os.path.splitdrive(plex_path)[1]
             # Combine the root drive with the path
@@ -189,96 +293,63 @@ def get_local_path(plex_path, root_path, item_type):
     
     # For movies, extract the movie folder and filename
     if item_type == 'movie':
-        movie_folder = normalize_unicode(os.path.basename(os.path.dirname(plex_path)))
-        movie_filename = normalize_unicode(os.path.basename(plex_path))
+        movie_folder = paths.folder_name
+        movie_filename = paths.base_name
         
         logger.debug(f"Looking for movie folder: {movie_folder}")
         logger.debug(f"Looking for movie file: {movie_filename}")
         
-        # Search for the movie folder in the root path
-        for root, dirs, files in os.walk(root_path):
-            # On Windows, do case-insensitive comparison
-            if platform.system() == 'Windows':
-                matching_dirs = [d for d in dirs if d.lower() == movie_folder.lower()]
-                if matching_dirs:
-                    # Find the actual directory name with preserved case
-                    actual_folder = matching_dirs[0]
-                    folder_path = os.path.join(root, actual_folder)
-                    
-                    logger.debug(f"Found matching folder: {folder_path}")
-                    
-                    # Look for the file in this folder
-                    if os.path.exists(os.path.join(folder_path, movie_filename)):
-                        return os.path.join(folder_path, movie_filename)
-                    
-                    # If exact match not found, try case-insensitive search for the file
-                    for file in os.listdir(folder_path):
-                        if file.lower() == movie_filename.lower():
-                            return os.path.join(folder_path, file)
-            else:
-                # On Linux/Mac, do case-sensitive comparison
-                if movie_folder in dirs:
-                    potential_path = os.path.join(root, movie_folder, movie_filename)
-                    if os.path.exists(potential_path):
-                        return potential_path
+        # Look up the movie folder in the directory index
+        for folder_path in lookup_index(dir_index['dirs'], movie_folder):
+            logger.debug(f"Found matching folder: {folder_path}")
+            
+            # Look for the file in this folder
+            potential_path = os.path.join(folder_path, movie_filename)
+            if os.path.exists(potential_path):
+                return potential_path
+            
+            # On Windows, try case-insensitive search for the file
+            if _IS_WINDOWS:
+                matching_file = list_folder(folder_path).get(os.path.normcase(movie_filename))
+                if matching_file:
+                    return matching_file
         
         # If folder-based search failed, try searching for the filename directly
-        movie_name_without_ext = os.path.splitext(movie_filename)[0]
+        movie_name_without_ext = paths.stem
         logger.debug(f"Folder search failed, looking for filename: {movie_name_without_ext}")
         
-        for root, dirs, files in os.walk(root_path):
-            for file in files:
-                file_without_ext = os.path.splitext(file)[0]
-                if platform.system() == 'Windows':
-                    if file_without_ext.lower() == movie_name_without_ext.lower():
-                        return os.path.join(root, file)
-                else:
-                    if file_without_ext == movie_name_without_ext:
-                        return os.path.join(root, file)
+        matching_files = lookup_index(dir_index['files'], movie_name_without_ext)
+        if matching_files:
+            return matching_files[0]
     
     # For TV shows, find the show folder
     else:
-        show_name = normalize_unicode(os.path.basename(plex_path))
+        show_name = paths.base_name
         logger.debug(f"Looking for TV show folder: {show_name}")
         
-        # Search for the directory in the root path
-        for root, dirs, _ in os.walk(root_path):
-            # On Windows, do case-insensitive comparison
-            if platform.system() == 'Windows':
-                for dir_name in dirs:
-                    if dir_name.lower() == show_name.lower():
-                        return os.path.join(root, dir_name)
-            else:
-                # On Linux/Mac, do case-sensitive comparison
-                if show_name in dirs:
-                    return os.path.join(root, show_name)
+        # Look up the show folder in the directory index
+        matching_dirs = lookup_index(dir_index['dirs'], show_name)
+        if matching_dirs:
+            return matching_dirs[0]
         
         # If exact match failed, try partial matching for TV shows
         logger.debug(f"Exact match failed, trying partial match for TV show: {show_name}")
         best_match = None
         best_match_score = 0
         
-        for root, dirs, _ in os.walk(root_path):
-            for dir_name in dirs:
-                # Simple similarity check - what percentage of characters match
-                if platform.system() == 'Windows':
-                    show_lower = show_name.lower()
-                    dir_lower = dir_name.lower()
-                    
-                    # Check if one is a substring of the other
-                    if show_lower in dir_lower or dir_lower in show_lower:
-                        # Calculate similarity score (higher is better)
-                        score = len(set(show_lower) & set(dir_lower)) / max(len(show_lower), len(dir_lower))
-                        if score > best_match_score:
-                            best_match_score = score
-                            best_match = os.path.join(root, dir_name)
-                else:
-                    # Case-sensitive partial matching for Unix systems
-                    if show_name in dir_name or dir_name in show_name:
-                        score = len(set(show_name) & set(dir_name)) / max(len(show_name), len(dir_name))
-                        if score > best_match_score:
-                            best_match_score = score
-                            best_match = os.path.join(root, dir_name)
+        # Index keys are normcased, so comparing against them is case-insensitive
+        # on Windows and case-sensitive on Unix systems
+        show_key = os.path.normcase(show_name)
+        show_chars = set(show_key)
+        
+        for dir_key, dir_paths in dir_index['dirs'].items():
+            # Check if one is a substring of the other
+            if show_key in dir_key or dir_key in show_key:
+                # Simple similarity check - what percentage of characters match (higher is better)
+                score = len(show_chars & set(dir_key)) / max(len(show_key), len(dir_key))
+                if score > best_match_score:
+                    best_match_score = score
+                    best_match = dir_paths[0]
         
         # If we found a reasonably good match
         if best_match_score > 0.7:  # Threshold for accepting a partial match
@@ -286,9 +357,9 @@ def get_local_path(plex_path, root_path, item_type):
             return best_match
     
     # If we can't find a match, try a simple drive letter replacement as last resort
-    if platform.system() == 'Windows':
+    if _IS_WINDOWS:
         # Replace the drive letter but preserve case of the path
-        root_drive = os.path.splitdrive(root_path)[0]
+        root_drive = dir_index['root_drive']
         path_without_drive = os.path.splitdrive(plex_path)[1]
         mapped_path = root_drive + path_without_drive
         
@@ -297,89 +368,191 @@ def get_local_path(plex_path, root_path, item_type):
             logger.info(f"Found path by drive letter replacement: {mapped_path}")
             return mapped_path
     
-    # If we can't find a match, log a warning and return the original path
+    # If we can't find a match, log a warning and use the Plex path only if it exists locally
     logger.warning(f"Could not find {plex_path} under {root_path}")
-    return plex_path
+    return plex_path if os.path.exists(plex_path) else None
+
+def get_nfo_path(local_path, paths, item_type):
+    """Return the NFO path for a resolved local path."""
+    # For TV shows, tvshow.nfo goes in the show folder
+    if item_type == 'tv':
+        return os.path.join(local_path, "tvshow.nfo")
+    
+    # For movies, the .nfo file goes next to the movie file
+    movie_dir, movie_file = os.path.split(local_path)
+    # Reuse the parsed stem unless the local file was matched under another name
+    if movie_file == paths.base_name:
+        movie_filename = paths.stem
+    else:
+        movie_filename = os.path.splitext(movie_file)[0]
+    return os.path.join(movie_dir, f"{movie_filename}.nfo")
 
-def create_nfo_file(plex_path, ids, item_type, root_path, dry_run=False):
+def create_nfo_file(paths, local_path, ids, item_type, dry_run=False):
+    """Write the NFO file for an item whose local path is already resolved."""
     try:
-        # Get the appropriate local path
-        local_path = get_local_path(plex_path, root_path, item_type)
-        
-        # Verify the path exists
-        if not os.path.exists(local_path):
-            logger.error(f"Path does not exist: {local_path}")
+        # Create content from the first available ID in preference order
+        scheme = next((scheme for scheme in _GUID_SCHEMES[item_type] if ids[scheme]), None)
+        if scheme is None:
+            logger.warning(f"No valid ID found for {'TV show' if item_type == 'tv' else 'movie'} at {local_path}")
             return False
+        content = _URL_TEMPLATES[scheme].format(ids[scheme])
         
-        # For TV shows, create tvshow.nfo in the show folder
-        if item_type == 'tv':
-            if not os.path.isdir(local_path):
-                logger.error(f"TV show path is not a directory: {local_path}")
-                return False
-            
-            nfo_path = os.path.join(local_path, "tvshow.nfo")
-            
-            # Check write permissions
-            if not os.access(local_path, os.W_OK):
-                logger.error(f"Cannot write to directory: {local_path}")
-                return False
-            
-            # Create content with available IDs
-            if ids['imdb']:
-                content = f"https://www.imdb.com/title/{ids['imdb']}/"
-            elif ids['tvdb']:
-                content = f"https://thetvdb.com/series/{ids['tvdb']}"
-            else:
-                logger.warning(f"No valid ID found for TV show at {local_path}")
-                return False
-        
-        # For movies, create .nfo file next to the movie file
-        else:
-            if not os.path.isfile(local_path):
-                logger.error(f"Movie path is not a file: {local_path}")
-                return False
-            
-            movie_dir = os.path.dirname(local_path)
-            movie_filename = os.path.splitext(os.path.basename(local_path))[0]
-            nfo_path = os.path.join(movie_dir, f"{movie_filename}.nfo")
-            
-            # Check write permissions
-            if not os.access(movie_dir, os.W_OK):
-                logger.error(f"Cannot write to directory: {movie_dir}")
-                return False
-            
-            # Create content with available IDs
-            if ids['imdb']:
-                content = f"https://www.imdb.com/title/{ids['imdb']}/"
-            elif ids['tmdb']:
-                content = f"https://www.themoviedb.org/movie/{ids['tmdb']}"
-            else:
-                logger.warning(f"No valid ID found for movie at {local_path}")
-                return False
+        nfo_path = get_nfo_path(local_path, paths, item_type)
         
         # Handle dry run
         if dry_run:
+            if not os.path.exists(local_path):
+                logger.error(f"Path does not exist: {local_path}")
+                return False
             logger.info(f"[DRY RUN] Would create NFO file at: {nfo_path}")
             return True
         
-        # Write the NFO file with UTF-8 encoding
-        with open(nfo_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        # Write the NFO file with UTF-8 encoding, letting the open call report
+        # missing or unwritable paths instead of checking them up front.
+        # The files are tiny, so skip the buffered file object entirely.
+        data = content.encode("utf-8")
+        try:
+            fd = os.open(nfo_path, _NFO_OPEN_FLAGS, 0o644)
+        except FileNotFoundError:
+            logger.error(f"Path does not exist: {local_path}")
+            return False
+        except NotADirectoryError:
+            logger.error(f"Path is not a directory: {os.path.dirname(nfo_path)}")
+            return False
+        except IsADirectoryError:
+            logger.error(f"NFO path is a directory: {nfo_path}")
+            return False
+        except PermissionError:
+            logger.error(f"Cannot write to directory: {os.path.dirname(nfo_path)}")
+            return False
+        
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
         
         logger.info(f"Created NFO file at: {nfo_path}")
         return True
     except Exception as e:
-        logger.error(f"Failed to create NFO file for {plex_path}: {e}")
+        logger.error(f"Failed to create NFO file for {paths.plex_path}: {e}")
         return False
 
-def process_library(plex, library_name, library_type, root_path, dry_run=False):
+def process_item(item, library_type, root_path, dir_index, dry_run=False, force=False):
+    """Extract IDs for a Plex item and create its NFO file.
+    
+    Returns a (status, method) tuple where status is "success", "failed",
+    "skipped" or "existing" (an NFO file is already present) and method is the
+    ID extraction method used, if any. Existing NFO files are detected before
+    IDs are extracted, so those items have no method.
+    """
+    logger.info(f"Processing {library_type}: {item.title}")
+    # Skip items without locations
+    if not item.locations or len(item.locations) == 0:
+        logger.warning(f"Skipping {item.title}: No location found")
+        return "skipped", None
+    
+    try:
+        paths = ItemPaths.from_plex_path(item.locations[0])
+        
+        # Skip items that already have an NFO file before extracting IDs
+        local_path = get_local_path(paths, root_path, library_type, dir_index)
+        if local_path is not None and not force:
+            nfo_path = get_nfo_path(local_path, paths, library_type)
+            if os.path.exists(nfo_path):
+                logger.info(f"Skipping {item.title}: NFO file already exists at {nfo_path}")
+                return "existing", None
+    except Exception as e:
+        logger.error(f"Failed to create NFO file for {item.locations[0]}: {e}")
+        local_path = None
+    
+    # Get IDs (also for items that will fail, so the method totals cover them)
+    ids, method = get_ids(item, library_type)
+    
+    if local_path is None:
+        return "failed", method
+    
+    # Create NFO file if we have at least one ID
+    if not any(ids[scheme] for scheme in _GUID_SCHEMES[library_type]):
+        logger.warning(f"No IDs found for {item.title}")
+        return "failed", method
+    
+    if create_nfo_file(paths, local_path, ids, library_type, dry_run):
+        return "success", method
+    return "failed", method
+
+def iter_library_pages(section, total):
+    """Yield the section's items one page at a time, with their guids included."""
+    for start in range(0, total, _PLEX_PAGE_SIZE):
+        # Fetching guids with the listing avoids a metadata reload request per item
+        page = section.search(libtype=section.TYPE, includeGuids=True, container_start=start,
+                              container_size=_PLEX_PAGE_SIZE, maxresults=_PLEX_PAGE_SIZE)
+        if not page:
+            return
+        yield page
+
+async def process_items(pages, total, library_type, root_path, dir_index, dry_run=False, force=False, workers=64):
+    """Run process_item for all items on worker threads and tally the results.
+    
+    Plex attribute access, path lookups and NFO writes all block on I/O, so up
+    to `workers` items are processed at once. The next page is fetched from
+    Plex while the current one is processed, and at most one page of items
+    waits ahead of the workers.
+    """
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=workers))
+    semaphore = asyncio.Semaphore(workers)
+    counts = {'success': 0, 'failed': 0, 'skipped': 0, 'existing': 0, 'primary': 0, 'secondary': 0}
+    
+    async def run(item):
+        async with semaphore:
+            return await asyncio.to_thread(process_item, item, library_type, root_path, dir_index, dry_run, force)
+    
+    def fetch_next_page():
+        return asyncio.create_task(asyncio.to_thread(next, pages, None))
+    
+    # Process items with progress bar
+    item_type = "movies" if library_type == "movie" else "TV shows"
+    fetch = fetch_next_page()
+    exhausted = False
+    pending = set()
+    with tqdm(total=total, desc=f"Processing {item_type}", unit="item") as progress:
+        while fetch or pending:
+            done, _ = await asyncio.wait(pending | {fetch} if fetch else pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task is fetch:
+                    page = task.result()
+                    fetch = None
+                    if page is None:
+                        exhausted = True
+                    else:
+                        pending.update(asyncio.create_task(run(item)) for item in page)
+                    continue
+                
+                pending.discard(task)
+                status, method = task.result()
+                counts[status] += 1
+                # Track method used
+                if method is not None:
+                    counts[method] += 1
+                progress.update(1)
+            
+            # Fetch the next page once the backlog drops below a page
+            if fetch is None and not exhausted and len(pending) < _PLEX_PAGE_SIZE:
+                fetch = fetch_next_page()
+    
+    return counts
+
+def process_library(plex, library_name, library_type, root_path, dry_run=False, workers=64, force=False):
 
+    # Normalize the root path once for the whole run
+    root_path = normalize_path(normalize_unicode(root_path))
+    
     try:
         # Get the library section
         section = plex.library.section(library_name)
-        items = section.all()
+        total = section.totalViewSize(libtype=section.TYPE, includeCollections=False)
         
-        logger.info(f"Processing {len(items)} items in {library_type} library '{library_name}'")
+        logger.info(f"Processing {total} items in {library_type} library '{library_name}'")
         logger.info(f"Using root path: {root_path}")
         
         # Verify root path exists
@@ -387,49 +560,21 @@ def process_library(plex, library_name, library_type, root_path, dry_run=False):
             logger.error(f"Root path is not a valid directory: {root_path}")
             sys.exit(1)
         
-        success_count = 0
-        failed_count = 0
-        skipped_count = 0
-        primary_count = 0
-        secondary_count = 0
+        # Index the library folder once instead of walking it for every item
+        dir_index = build_dir_index(root_path, library_type)
+        logger.info(f"Indexed {sum(len(entries) for entries in dir_index['dirs'].values())} directories under {root_path}")
         
-        # Process items with progress bar
-        item_type = "movies" if library_type == "movie" else "TV shows"
-        for item in tqdm(items, desc=f"Processing {item_type}", unit="item"):
-            logger.info(f"Processing {library_type}: {item.title}")
-            # Skip items without locations
-            if not item.locations or len(item.locations) == 0:
-                logger.warning(f"Skipping {item.title}: No location found")
-                skipped_count += 1
-                continue
-            
-            item_path = item.locations[0]
-            
-            # Get IDs
-            ids, method = get_ids(item, library_type)
-            
-            # Track method used
-            if method == "primary":
-                primary_count += 1
-            else:
-                secondary_count += 1
-            
-            # Create NFO file if we have at least one ID
-            has_id = ids['imdb'] or (ids['tmdb'] and library_type == 'movie') or (ids['tvdb'] and library_type == 'tv')
-            if has_id:
-                if create_nfo_file(item_path, ids, library_type, root_path, dry_run):
-                    success_count += 1
-                else:
-                    failed_count += 1
-            else:
-                logger.warning(f"No IDs found for {item.title}")
-                failed_count += 1
+        # Stream items from Plex page by page instead of loading the whole library first
+        pages = iter_library_pages(section, total)
+        counts = asyncio.run(process_items(pages, total, library_type, root_path, dir_index, dry_run, force, workers))
         
         # Log results
-        logger.info(f"Completed processing {len(items)} {item_type}")
-        logger.info(f"Success: {success_count}, Failed: {failed_count}, Skipped: {skipped_count}")
-        logger.info(f"IDs found using primary method: {primary_count}")
-        logger.info(f"IDs found using secondary method: {secondary_count}")
+        item_type = "movies" if library_type == "movie" else "TV shows"
+        logger.info(f"Completed processing {total} {item_type}")
+        logger.info(f"Success: {counts['success']}, Failed: {counts['failed']}, Skipped: {counts['skipped'] + counts['existing']}")
+        logger.info(f"Skipped because an NFO file already exists: {counts['existing']}")
+        logger.info(f"IDs found using primary method: {counts['primary']}")
+        logger.info(f"IDs found using secondary method: {counts['secondary']}")
         
     except NotFound:
         logger.error(f"Library '{library_name}' not found on Plex server")
@@ -450,7 +595,7 @@ def main():
     plex = connect_to_plex(args.url, args.token)
     
     # Process library
-    process_library(plex, args.library, args.type, args.root_path, args.dry_run)
+    process_library(plex, args.library, args.type, args.root_path, args.dry_run, args.workers, args.force)
     
     logger.info("Plex NFO Creator completed")
 